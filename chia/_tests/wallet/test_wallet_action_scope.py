@@ -13,7 +13,7 @@ from chia.util.ints import uint64
 from chia.wallet.signer_protocol import SigningResponse
 from chia.wallet.transaction_record import TransactionRecord
 from chia.wallet.util.tx_config import DEFAULT_TX_CONFIG
-from chia.wallet.wallet_action_scope import WalletSideEffects
+from chia.wallet.wallet_action_scope import WalletSideEffects, _StreamableWalletSideEffects
 from chia.wallet.wallet_spend_bundle import WalletSpendBundle
 from chia.wallet.wallet_state_manager import WalletStateManager
 
@@ -31,6 +31,12 @@ def test_back_and_forth_serialization() -> None:
     assert WalletSideEffects.from_bytes(
         bytes(WalletSideEffects([STD_TX, STD_TX], [MOCK_SR, MOCK_SR], [MOCK_SB, MOCK_SB], [MOCK_COIN, MOCK_COIN]))
     ) == WalletSideEffects([STD_TX, STD_TX], [MOCK_SR, MOCK_SR], [MOCK_SB, MOCK_SB], [MOCK_COIN, MOCK_COIN])
+    # The wire format is defined by the streamable equivalent
+    assert bytes(WalletSideEffects([STD_TX], [MOCK_SR], [MOCK_SB], [MOCK_COIN])) == bytes(
+        _StreamableWalletSideEffects([STD_TX], [MOCK_SR], [MOCK_SB], [MOCK_COIN])
+    )
+    with pytest.raises(AssertionError):
+        WalletSideEffects.from_bytes(bytes(WalletSideEffects()) + b"\x00")
 
 
 @dataclass
@@ -83,3 +89,18 @@ async def test_wallet_action_scope() -> None:
 
     assert action_scope.side_effects.transactions == []
     assert wsm.most_recent_call == ([], False, True, True, [], [])
+
+    async with wsm.new_action_scope(DEFAULT_TX_CONFIG) as action_scope:  # type: ignore[attr-defined]
+        pass
+
+    assert action_scope.side_effects == WalletSideEffects()
+    assert wsm.most_recent_call == ([], False, True, None, [], [])
+
+    async with wsm.new_action_scope(  # type: ignore[attr-defined]
+        DEFAULT_TX_CONFIG, additional_signing_responses=[MOCK_SR], extra_spends=[MOCK_SB]
+    ) as action_scope:
+        pass
+
+    assert action_scope.side_effects.signing_responses == [MOCK_SR]
+    assert action_scope.side_effects.extra_spends == [MOCK_SB]
+    assert wsm.most_recent_call == ([], False, True, None, [MOCK_SR], [MOCK_SB])
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import contextlib
+import io
 from collections.abc import AsyncIterator
 from dataclasses import dataclass, field, replace
-from typing import TYPE_CHECKING, Optional, cast, final
+from typing import TYPE_CHECKING, Any, Optional, cast, final
 
 from chia.types.blockchain_format.coin import Coin
 from chia.util.action_scope import ActionScope
@@ -34,12 +35,24 @@ class WalletSideEffects:
     extra_spends: list[WalletSpendBundle] = field(default_factory=list)
     selected_coins: list[Coin] = field(default_factory=list)
 
+    # _StreamableWalletSideEffects defines the wire format but we stream the fields directly rather than construct it,
+    # which would copy (and type check) every list on each save/load of an action scope
+
     def __bytes__(self) -> bytes:
-        return bytes(_StreamableWalletSideEffects(**self.__dict__))
+        f = io.BytesIO()
+        for streamable_field in _StreamableWalletSideEffects.streamable_fields():
+            streamable_field.stream_function(getattr(self, streamable_field.name), f)
+        return f.getvalue()
 
     @classmethod
     def from_bytes(cls, blob: bytes) -> WalletSideEffects:
-        return cls(**_StreamableWalletSideEffects.from_bytes(blob).__dict__)
+        f = io.BytesIO(blob)
+        parsed_fields: dict[str, Any] = {
+            streamable_field.name: streamable_field.parse_function(f)
+            for streamable_field in _StreamableWalletSideEffects.streamable_fields()
+        }
+        assert f.read() == b""
+        return cls(**parsed_fields)
 
 
 @final
@@ -72,17 +85,23 @@ async def new_wallet_action_scope(
     push: bool = False,
     merge_spends: bool = True,
     sign: Optional[bool] = None,
-    additional_signing_responses: list[SigningResponse] = [],
-    extra_spends: list[WalletSpendBundle] = [],
+    additional_signing_responses: Optional[list[SigningResponse]] = None,
+    extra_spends: Optional[list[WalletSpendBundle]] = None,
 ) -> AsyncIterator[WalletActionScope]:
+    if additional_signing_responses is None:
+        additional_signing_responses = []
+    if extra_spends is None:
+        extra_spends = []
     async with ActionScope.new_scope(
         WalletSideEffects,
         WalletActionConfig(push, merge_spends, sign, additional_signing_responses, extra_spends, tx_config),
     ) as self:
         self = cast(WalletActionScope, self)
-        async with self.use() as interface:
-            interface.side_effects.signing_responses = additional_signing_responses.copy()
-            interface.side_effects.extra_spends = extra_spends.copy()
+        # The side effects are serialized on exit from `use()` so there is no aliasing to guard against with a copy
+        if len(additional_signing_responses) > 0 or len(extra_spends) > 0:
+            async with self.use() as interface:
+                interface.side_effects.signing_responses = additional_signing_responses
+                interface.side_effects.extra_spends = extra_spends
 
         yield self
 
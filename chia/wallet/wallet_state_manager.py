@@ -2803,8 +2803,8 @@ class WalletStateManager:
         push: bool = False,
         merge_spends: bool = True,
         sign: Optional[bool] = None,
-        additional_signing_responses: list[SigningResponse] = [],
-        extra_spends: list[WalletSpendBundle] = [],
+        additional_signing_responses: Optional[list[SigningResponse]] = None,
+        extra_spends: Optional[list[WalletSpendBundle]] = None,
     ) -> AsyncIterator[WalletActionScope]:
         async with new_wallet_action_scope(
             self,